@@ -6,6 +6,8 @@ const state = {
   justCalculated: false
 };
 
+const OPERATOR_SYMBOLS = { add: '+', subtract: '−', multiply: '×', divide: '÷' };
+
 const expressionEl = document.getElementById('expression');
 const mainValueEl = document.getElementById('main-value');
 const modeLabel = document.getElementById('mode-label');
@@ -18,13 +20,19 @@ const baseInput = document.getElementById('base-input');
 const rateInput = document.getElementById('rate-input');
 const percentResult = document.getElementById('percent-result');
 
+const setText = (el, text) => {
+  if (el.textContent !== text) el.textContent = text;
+};
+
 const updateDisplay = () => {
-  mainValueEl.textContent = state.current;
-  const opSymbol = { add: '+', subtract: '−', multiply: '×', divide: '÷' }[state.operator] || '';
+  setText(mainValueEl, state.current);
+  const opSymbol = OPERATOR_SYMBOLS[state.operator] || '';
   const prevText = state.previous !== null ? `${state.previous} ${opSymbol}` : state.current;
-  expressionEl.textContent = prevText || '0';
-  modeLabel.textContent = state.mode === 'standard' ? 'Standard' : 'Percent';
-  document.body.setAttribute('data-mode', state.mode);
+  setText(expressionEl, prevText || '0');
+  setText(modeLabel, state.mode === 'standard' ? 'Standard' : 'Percent');
+  if (document.body.getAttribute('data-mode') !== state.mode) {
+    document.body.setAttribute('data-mode', state.mode);
+  }
 };
 
 const resetCalc = () => {
@@ -100,6 +108,12 @@ const toggleMenu = () => {
   modeToggle.setAttribute('aria-expanded', open);
 };
 
+const closeMenu = () => {
+  if (!modeMenu.classList.contains('open')) return;
+  modeMenu.classList.remove('open');
+  modeToggle.setAttribute('aria-expanded', 'false');
+};
+
 const setMode = (mode) => {
   state.mode = mode;
   if (mode === 'standard') {
@@ -110,8 +124,7 @@ const setMode = (mode) => {
     percentPanel.hidden = false;
     baseInput.focus();
   }
-  modeMenu.classList.remove('open');
-  modeToggle.setAttribute('aria-expanded', 'false');
+  closeMenu();
   updateDisplay();
 };
 
@@ -122,29 +135,27 @@ const computePercentResult = () => {
   percentResult.textContent = `${rate.toFixed(2)}% of ${base.toFixed(2)} = ${output.toFixed(2)}`;
 };
 
-document.querySelectorAll('[data-digit]').forEach((btn) => {
-  btn.addEventListener('click', () => {
-    handleDigit(btn.dataset.digit);
-    updateDisplay();
-  });
-});
-
-document.querySelectorAll('[data-operator]').forEach((btn) => {
-  btn.addEventListener('click', () => {
-    applyOperator(btn.dataset.operator);
-    updateDisplay();
-  });
-});
+const ACTIONS = {
+  clear: resetCalc,
+  invert,
+  percent: quickPercent,
+  equals: compute
+};
 
-document.querySelectorAll('[data-action]').forEach((btn) => {
-  btn.addEventListener('click', () => {
-    const action = btn.dataset.action;
-    if (action === 'clear') resetCalc();
-    if (action === 'invert') invert();
-    if (action === 'percent') quickPercent();
-    if (action === 'equals') compute();
-    updateDisplay();
-  });
+calcPanel.addEventListener('click', (event) => {
+  const btn = event.target.closest('button');
+  if (!btn) return;
+  const { digit, operator, action } = btn.dataset;
+  if (digit !== undefined) {
+    handleDigit(digit);
+  } else if (operator) {
+    applyOperator(operator);
+  } else if (ACTIONS[action]) {
+    ACTIONS[action]();
+  } else {
+    return;
+  }
+  updateDisplay();
 });
 
 modeToggle.addEventListener('click', toggleMenu);
@@ -154,15 +165,13 @@ modeOptions.forEach((option) => {
 
 document.addEventListener('click', (event) => {
   if (!modeMenu.contains(event.target) && !modeToggle.contains(event.target)) {
-    modeMenu.classList.remove('open');
-    modeToggle.setAttribute('aria-expanded', 'false');
+    closeMenu();
   }
 });
 
 document.addEventListener('keydown', (event) => {
   if (event.key === 'Escape') {
-    modeMenu.classList.remove('open');
-    modeToggle.setAttribute('aria-expanded', 'false');
+    closeMenu();
   }
 });
 